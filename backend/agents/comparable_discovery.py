@@ -1,15 +1,54 @@
-from typing import Dict, List
-from pydantic import BaseModel
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 from math import radians, sin, cos, sqrt, atan2
-from backend.utils.validation import ValidatedProperty
+import numpy as np
+from backend.utils.validation import ValidatedProperty, PropertyType
+from backend.utils.data_analysis import EARTH_RADIUS_KM, haversine_distances
 
-class ComparableProperty(BaseModel):
+# Candidate count above which scoring is moved off the event loop
+OFFLOAD_THRESHOLD = 500
+
+# Distance and age gaps at which location and age similarity reach 0
+LOCATION_SIMILARITY_KM = 5.0
+AGE_SIMILARITY_YEARS = 10.0
+
+@dataclass(slots=True)
+class ComparableProperty:
+    """Scored candidate; built once per candidate, so kept as a slotted dataclass"""
     property: ValidatedProperty
     similarity_score: float
     confidence_score: float
     matching_factors: Dict[str, float]
 
-    model_config = {"arbitrary_types_allowed": True}
+@dataclass(slots=True)
+class CandidateColumns:
+    """Per-candidate fields used for scoring, one array per field"""
+    ids: np.ndarray
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+    sizes: np.ndarray
+    years: np.ndarray  # 0 where year_built is missing
+    prices: np.ndarray  # 0 where current_value is missing
+    type_codes: np.ndarray
+    type_ids: Dict[Optional[PropertyType], int]
+    completeness: np.ndarray  # Confidence from data completeness alone
+
+    def take(self, mask: np.ndarray) -> "CandidateColumns":
+        """
+        Returns the columns of the candidates selected by a boolean mask
+        """
+        return CandidateColumns(
+            ids=self.ids[mask],
+            latitudes=self.latitudes[mask],
+            longitudes=self.longitudes[mask],
+            sizes=self.sizes[mask],
+            years=self.years[mask],
+            prices=self.prices[mask],
+            type_codes=self.type_codes[mask],
+            type_ids=self.type_ids,
+            completeness=self.completeness[mask]
+        )
 
 class ComparableDiscoveryAgent:
     def __init__(self):
@@ -38,19 +77,238 @@ class ComparableDiscoveryAgent:
         Returns:
             List of comparable properties sorted by similarity score
         """
-        comparables = []
+        if len(all_properties) >= OFFLOAD_THRESHOLD:
+            # Large candidate sets are CPU bound; score them in a worker
+            # thread so other requests keep being served meanwhile
+            return await asyncio.to_thread(
+                self._rank_comparables, target_property, all_properties, limit
+            )
+        return self._rank_comparables(target_property, all_properties, limit)
+
+    async def find_comparables_batch(
+        self,
+        target_properties: List[ValidatedProperty],
+        all_properties: List[ValidatedProperty],
+        limit: int = 5
+    ) -> List[List[ComparableProperty]]:
+        """
+        Finds comparable properties for several targets against one candidate pool
+        
+        Args:
+            target_properties: The properties to find comparables for
+            all_properties: List of all available properties
+            limit: Maximum number of comparables to return per target
+            
+        Returns:
+            One list of comparables per target, in target order
+        """
+        if len(all_properties) >= OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(
+                self._rank_comparables_batch, target_properties, all_properties, limit
+            )
+        return self._rank_comparables_batch(target_properties, all_properties, limit)
+
+    def _rank_comparables_batch(
+        self,
+        target_properties: List[ValidatedProperty],
+        all_properties: List[ValidatedProperty],
+        limit: int
+    ) -> List[List[ComparableProperty]]:
+        """
+        Ranks candidates for every target, extracting the candidate columns only once
+        """
+        columns = self._build_candidate_columns(all_properties)
+        return [
+            self._rank_comparables(target_property, all_properties, limit, columns)
+            for target_property in target_properties
+        ]
+
+    def _rank_comparables(
+        self,
+        target_property: ValidatedProperty,
+        all_properties: List[ValidatedProperty],
+        limit: int,
+        columns: Optional[CandidateColumns] = None
+    ) -> List[ComparableProperty]:
+        """
+        Scores every candidate against the target and returns the top matches
+        Columns prebuilt from all_properties may be passed in to skip extracting them
+        """
+        if columns is None:
+            columns = self._build_candidate_columns(all_properties)
+        
+        # Leave the target itself out of its own candidates
+        candidates = all_properties
+        keep = columns.ids != target_property.id
+        if not keep.all():
+            candidates = [all_properties[index] for index in np.flatnonzero(keep).tolist()]
+            columns = columns.take(keep)
+        
+        # Score every factor for all candidates at once
+        factor_scores = self._calculate_factor_similarities(target_property, columns)
+        similarity_scores = self._calculate_similarity_scores(factor_scores)
+        confidence_scores = self._calculate_confidence_scores(columns, factor_scores)
+        
+        # Pick the top matches by similarity score before building any result
+        # objects; the stable sort keeps ties in candidate order
+        top = np.argsort(-similarity_scores, kind='stable')[:limit]
+        
+        factors = list(factor_scores)
+        factor_rows = zip(*(scores[top].tolist() for scores in factor_scores.values()))
+        return [
+            ComparableProperty(
+                property=candidates[index],
+                similarity_score=similarity_score,
+                confidence_score=confidence_score,
+                matching_factors=dict(zip(factors, row))
+            )
+            for index, similarity_score, confidence_score, row in zip(
+                top.tolist(),
+                similarity_scores[top].tolist(),
+                confidence_scores[top].tolist(),
+                factor_rows
+            )
+        ]
+    
+    def _build_candidate_columns(
+        self,
+        candidates: List[ValidatedProperty]
+    ) -> CandidateColumns:
+        """
+        Extracts the fields scoring reads from each candidate into arrays
+        """
+        count = len(candidates)
+        weights = self.weight_factors
+        
+        def column(values):
+            return np.fromiter(values, dtype=float, count=count)
+        
+        # Validated types are enum singletons, so equal codes mean the same type
+        type_ids = {}
+        type_codes = np.fromiter(
+            (type_ids.setdefault(p.property_type, len(type_ids)) for p in candidates),
+            dtype=int,
+            count=count
+        )
+        
+        # Base confidence on data completeness
+        completeness = (
+            weights["location"] * column(p.latitude != 0 and p.longitude != 0 for p in candidates) +
+            weights["size"] * column(p.metrics.total_square_feet > 0 for p in candidates) +
+            weights["age"] * column(p.metrics.year_built is not None for p in candidates) +
+            weights["type"] * column(p.property_type is not None for p in candidates) +
+            weights["price"] * column(p.financials.current_value is not None for p in candidates)
+        )
+        
+        return CandidateColumns(
+            ids=np.array([p.id for p in candidates], dtype=object),
+            latitudes=column(p.latitude for p in candidates),
+            longitudes=column(p.longitude for p in candidates),
+            sizes=column(p.metrics.total_square_feet for p in candidates),
+            years=column(p.metrics.year_built or 0 for p in candidates),
+            prices=column(p.financials.current_value or 0 for p in candidates),
+            type_codes=type_codes,
+            type_ids=type_ids,
+            completeness=completeness
+        )
+    
+    def _calculate_factor_similarities(
+        self,
+        target: ValidatedProperty,
+        columns: CandidateColumns
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized per-factor scores of calculate_similarity for many candidates
+        Returns one array of scores per factor, in weight_factors order
+        """
+        count = len(columns.ids)
         
-        for property in all_properties:
-            if property.id == target_property.id:
-                continue
-                
-            comparable = self.calculate_similarity(target_property, property)
-            comparable.confidence_score = self.calculate_confidence(comparable)
-            comparables.append(comparable)
+        # Location similarity using the Haversine formula
+        location_scores = self._calculate_location_similarities(
+            target.latitude,
+            target.longitude,
+            columns.latitudes,
+            columns.longitudes
+        )
+        
+        # Size similarity; non-positive sizes score 0
+        target_size = target.metrics.total_square_feet
+        sizes = columns.sizes
+        with np.errstate(divide='ignore', invalid='ignore'):
+            size_scores = np.where(
+                (sizes > 0) & (target_size > 0),
+                np.maximum(0, 1 - np.abs(target_size - sizes) / np.maximum(target_size, sizes)),
+                0.0
+            )
+        
+        # Age similarity; neutral score if either year_built is missing
+        target_year = target.metrics.year_built
+        years = columns.years
+        if target_year:
+            age_scores = np.where(
+                years != 0,
+                np.maximum(0, 1 - (np.abs(target_year - years) / AGE_SIMILARITY_YEARS)),
+                0.5
+            )
+        else:
+            age_scores = np.full(count, 0.5)
+        
+        # Property type similarity
+        target_type_code = columns.type_ids.get(target.property_type, -1)
+        type_scores = (columns.type_codes == target_type_code).astype(float)
         
-        # Sort by similarity score and return top matches
-        comparables.sort(key=lambda x: x.similarity_score, reverse=True)
-        return comparables[:limit]
+        # Price similarity; neutral score if either current_value is missing
+        target_price = target.financials.current_value
+        prices = columns.prices
+        if target_price:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                price_scores = np.where(
+                    prices != 0,
+                    np.maximum(0, 1 - np.abs(target_price - prices) / np.maximum(target_price, prices)),
+                    0.5
+                )
+        else:
+            price_scores = np.full(count, 0.5)
+        
+        return {
+            "location": location_scores,
+            "size": size_scores,
+            "age": age_scores,
+            "type": type_scores,
+            "price": price_scores
+        }
+    
+    def _calculate_similarity_scores(
+        self,
+        factor_scores: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Vectorized weighted similarity score of calculate_similarity
+        """
+        weights = self.weight_factors
+        return (
+            factor_scores["location"] * weights["location"] +
+            factor_scores["size"] * weights["size"] +
+            factor_scores["age"] * weights["age"] +
+            factor_scores["type"] * weights["type"] +
+            factor_scores["price"] * weights["price"]
+        )
+    
+    def _calculate_confidence_scores(
+        self,
+        columns: CandidateColumns,
+        factor_scores: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_confidence for many candidates
+        """
+        confidence_scores = columns.completeness
+        
+        # Reduce confidence once for every factor with very low similarity
+        for scores in factor_scores.values():
+            confidence_scores = np.where(scores < 0.5, confidence_scores * 0.8, confidence_scores)
+        
+        return confidence_scores
     
     def calculate_similarity(
         self, 
@@ -82,12 +340,12 @@ class ComparableDiscoveryAgent:
                 target.metrics.year_built,
                 candidate.metrics.year_built
             )
-            matching_factors["age"] = age_score
         else:
-            matching_factors["age"] = 0.5  # Neutral score if we can't compare ages
+            age_score = 0.5  # Neutral score if we can't compare ages
+        matching_factors["age"] = age_score
         
-        # Calculate property type similarity
-        type_score = 1.0 if target.property_type == candidate.property_type else 0.0
+        # Calculate property type similarity; validated types are enum singletons
+        type_score = 1.0 if target.property_type is candidate.property_type else 0.0
         matching_factors["type"] = type_score
         
         # Calculate price similarity if both properties have current_value
@@ -96,14 +354,19 @@ class ComparableDiscoveryAgent:
                 target.financials.current_value,
                 candidate.financials.current_value
             )
-            matching_factors["price"] = price_score
         else:
-            matching_factors["price"] = 0.5  # Neutral score if we can't compare prices
+            price_score = 0.5  # Neutral score if we can't compare prices
+        matching_factors["price"] = price_score
         
-        # Calculate weighted similarity score
-        similarity_score = sum(
-            score * self.weight_factors[factor]
-            for factor, score in matching_factors.items()
+        # Calculate weighted similarity score from the scores already in hand,
+        # rather than re-reading them back out of matching_factors
+        weights = self.weight_factors
+        similarity_score = (
+            location_score * weights["location"] +
+            size_score * weights["size"] +
+            age_score * weights["age"] +
+            type_score * weights["type"] +
+            price_score * weights["price"]
         )
         
         return ComparableProperty(
@@ -120,19 +383,16 @@ class ComparableDiscoveryAgent:
         """
         Calculates confidence score based on data completeness and similarity thresholds
         """
-        # Base confidence on data completeness
-        completeness_factors = {
-            "location": comparable.property.latitude != 0 and comparable.property.longitude != 0,
-            "size": comparable.property.metrics.total_square_feet > 0,
-            "age": comparable.property.metrics.year_built is not None,
-            "type": comparable.property.property_type is not None,
-            "price": comparable.property.financials.current_value is not None
-        }
+        property = comparable.property
+        weights = self.weight_factors
         
-        # Calculate confidence based on completeness and similarity thresholds
-        confidence_score = sum(
-            self.weight_factors[factor] * float(completeness)
-            for factor, completeness in completeness_factors.items()
+        # Base confidence on data completeness
+        confidence_score = (
+            weights["location"] * float(property.latitude != 0 and property.longitude != 0) +
+            weights["size"] * float(property.metrics.total_square_feet > 0) +
+            weights["age"] * float(property.metrics.year_built is not None) +
+            weights["type"] * float(property.property_type is not None) +
+            weights["price"] * float(property.financials.current_value is not None)
         )
         
         # Adjust confidence based on similarity thresholds
@@ -161,11 +421,27 @@ class ComparableDiscoveryAgent:
         dlon = lon2 - lon1
         a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
         c = 2 * atan2(sqrt(a), sqrt(1-a))
-        distance = 6371 * c  # Radius of Earth in km
+        distance = EARTH_RADIUS_KM * c
         
         # Convert distance to similarity score
         # Assuming properties within 5km are highly similar
-        return max(0, 1 - (distance / 5))
+        return max(0, 1 - (distance / LOCATION_SIMILARITY_KM))
+    
+    def _calculate_location_similarities(
+        self,
+        lat: float,
+        lon: float,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized _calculate_location_similarity of one location against many
+        Returns an array of scores between 0 and 1
+        """
+        distances = haversine_distances(lat, lon, latitudes, longitudes)
+        
+        # Properties within 5km are highly similar
+        return np.maximum(0, 1 - (distances / LOCATION_SIMILARITY_KM))
     
     def _calculate_size_similarity(
         self,
@@ -198,7 +474,7 @@ class ComparableDiscoveryAgent:
         # Calculate age difference
         age_diff = abs(year1 - year2)
         # Assuming properties within 10 years are similar
-        return max(0, 1 - (age_diff / 10))
+        return max(0, 1 - (age_diff / AGE_SIMILARITY_YEARS))
     
     def _calculate_type_similarity(
         self,
@@ -231,4 +507,7 @@ class ComparableDiscoveryAgent:
             
         # Calculate percentage difference
         price_diff = abs(price1 - price2) / max(price1, price2)
-        return max(0, 1 - price_diff) 
\ No newline at end of file
+        return max(0, 1 - price_diff)
+
+# Global comparable discovery agent instance
+comparable_agent = ComparableDiscoveryAgent()
@@ -5,15 +5,15 @@ import json
 from datetime import timedelta
 from backend.utils.health import health_monitor
 from backend.utils.logger import setup_logger
-from backend.utils.cache import Cache
+from backend.utils.cache import cache
 
 router = APIRouter(prefix="/api/health", tags=["health"])
 logger = setup_logger("health_routes")
-cache = Cache()
 
 def generate_etag(data: Dict) -> str:
     """Generate ETag for data"""
-    data_str = json.dumps(data, sort_keys=True)
+    # Compact separators: the string is only hashed, never read
+    data_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
     return hashlib.sha256(data_str.encode()).hexdigest()
 
 @router.get("")
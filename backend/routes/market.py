@@ -5,15 +5,15 @@ import hashlib
 import json
 from backend.utils.market_analysis import get_market_trends, get_price_distribution
 from backend.utils.logger import setup_logger
-from backend.utils.cache import Cache
+from backend.utils.cache import cache
 
 router = APIRouter(tags=["market"])
 logger = setup_logger("market_routes")
-cache = Cache()
 
 def generate_etag(data: Any) -> str:
     """Generate ETag for data"""
-    data_str = json.dumps(data, sort_keys=True)
+    # Compact separators: the string is only hashed, never read
+    data_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
     return hashlib.sha256(data_str.encode()).hexdigest()
 
 @router.get("/updates")
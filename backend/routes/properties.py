@@ -4,20 +4,24 @@ from datetime import datetime, timedelta
 import hashlib
 import json
 from backend.utils.logger import setup_logger
-from backend.utils.cache import Cache
+from backend.utils.cache import cache
 from backend.models.property import Property
 from backend.utils.db import get_db_session
 from sqlalchemy import select
-from backend.agents.comparable_discovery import ComparableDiscoveryAgent
+from sqlalchemy.orm import joinedload
+from backend.agents.comparable_discovery import comparable_agent
 from backend.utils.validation import ValidatedProperty, PropertyMetrics, PropertyFinancials, PropertyType, Address, ZoningType
 
 router = APIRouter(prefix="/api/properties", tags=["properties"])
 logger = setup_logger("property_routes")
-cache = Cache()
+
+# Lookup from normalized property_type input to enum member
+PROPERTY_TYPES_BY_VALUE = {property_type.value: property_type for property_type in PropertyType}
 
 def generate_etag(data: Any) -> str:
     """Generate ETag for data"""
-    data_str = json.dumps(data, sort_keys=True)
+    # Compact separators: the string is only hashed, never read
+    data_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
     return hashlib.sha256(data_str.encode()).hexdigest()
 
 @router.get("/updates")
@@ -192,17 +196,22 @@ async def get_comparables(
 
         # Parse address into components (simple split for now)
         # Assuming format: "street, city, state zipcode"
-        try:
-            street_part, rest = address_str.split(",", 1)
-            city_part, state_zip = rest.strip().rsplit(",", 1)
-            state, zip_code = state_zip.strip().split(" ", 1)
-            address = Address(
-                street=street_part.strip(),
-                city=city_part.strip(),
-                state=state.strip(),
-                zip_code=zip_code.strip()
-            )
-        except ValueError:
+        address = None
+        # Fewer than two commas can never parse, so skip the split and exception path
+        if address_str.count(",") >= 2:
+            try:
+                street_part, rest = address_str.split(",", 1)
+                city_part, state_zip = rest.strip().rsplit(",", 1)
+                state, zip_code = state_zip.strip().split(" ", 1)
+                address = Address(
+                    street=street_part.strip(),
+                    city=city_part.strip(),
+                    state=state.strip(),
+                    zip_code=zip_code.strip()
+                )
+            except ValueError:
+                pass
+        if address is None:
             address = Address(
                 street=address_str,
                 city="Unknown",
@@ -212,17 +221,7 @@ async def get_comparables(
 
         # Normalize and validate property_type
         property_type_str = str(property_type).strip().lower()
-        property_type_map = {
-            "industrial": PropertyType.INDUSTRIAL,
-            "warehouse": PropertyType.WAREHOUSE,
-            "manufacturing": PropertyType.MANUFACTURING,
-            "flex": PropertyType.FLEX,
-            "commercial": PropertyType.COMMERCIAL,
-            "retail": PropertyType.RETAIL,
-            "office": PropertyType.OFFICE,
-            "mixed_use": PropertyType.MIXED_USE,
-        }
-        property_type_enum = property_type_map.get(property_type_str)
+        property_type_enum = PROPERTY_TYPES_BY_VALUE.get(property_type_str)
         if not property_type_enum:
             raise HTTPException(status_code=400, detail=f"Invalid property_type: {property_type_str}")
 
@@ -248,9 +247,17 @@ async def get_comparables(
             raw_data={}
         )
 
-        # Fetch all properties from DB and convert to ValidatedProperty
+        # Fetch all properties from DB and convert to ValidatedProperty; the
+        # related rows are joined into the same query rather than lazy loaded
+        # one property at a time
         async with get_db_session() as session:
-            result = await session.execute(select(Property))
+            result = await session.execute(
+                select(Property).options(
+                    joinedload(Property.address),
+                    joinedload(Property.metrics),
+                    joinedload(Property.financials)
+                )
+            )
             db_properties = result.scalars().all()
             
             # Convert DB properties to ValidatedProperty instances
@@ -276,12 +283,11 @@ async def get_comparables(
                     )
                     all_properties.append(validated_prop)
                 except Exception as e:
-                    logger.warning(f"Failed to convert property {prop.id}: {str(e)}")
+                    logger.warning("Failed to convert property %s: %s", prop.id, e)
                     continue
 
-        # Use ComparableDiscoveryAgent to find comparables
-        agent = ComparableDiscoveryAgent()
-        comparables = await agent.find_comparables(target_property, all_properties, limit=5)
+        # Use the shared ComparableDiscoveryAgent to find comparables
+        comparables = await comparable_agent.find_comparables(target_property, all_properties, limit=5)
 
         # Format response for frontend
         response = {
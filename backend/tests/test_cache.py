@@ -0,0 +1,48 @@
+import asyncio
+import math
+import numpy as np
+import pytest
+from datetime import datetime
+from backend.utils.cache import Cache
+
+class FakeRedis:
+    """In-memory stand-in for the decode_responses Redis client"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value.decode() if isinstance(value, bytes) else value
+        return True
+
+def round_trip(value):
+    cache = Cache()
+    cache.redis = FakeRedis()
+
+    async def run():
+        stored = await cache.set('key', value)
+        return stored, await cache.get('key')
+
+    return asyncio.run(run())
+
+def test_round_trip_plain_values():
+    value = {'count': 3, 'mean': 1.5, 'tags': ['a', 'b'], 'missing': None}
+    assert round_trip(value) == (True, value)
+
+def test_round_trip_stringifies_non_str_keys():
+    assert round_trip({1: 'a', 2.5: 'b'}) == (True, {'1': 'a', '2.5': 'b'})
+
+def test_round_trip_numpy_values():
+    stored, value = round_trip({'mean': np.float64(1.5), 'count': np.int64(3), 'bins': np.arange(3)})
+    assert stored
+    assert value == {'mean': 1.5, 'count': 3, 'bins': [0, 1, 2]}
+
+@pytest.mark.parametrize('number', [math.nan, math.inf, -math.inf, np.float64('nan')])
+def test_round_trip_non_finite_floats_come_back_as_none(number):
+    assert round_trip({'mean': number, 'values': [1.0, number]}) == (True, {'mean': None, 'values': [1.0, None]})
+
+def test_set_rejects_datetimes():
+    assert round_trip({'created_at': datetime(2024, 1, 5)}) == (False, None)
@@ -0,0 +1,106 @@
+import asyncio
+import random
+import pytest
+from backend.agents.comparable_discovery import ComparableDiscoveryAgent, OFFLOAD_THRESHOLD
+from backend.utils.validation import (
+    ValidatedProperty,
+    PropertyMetrics,
+    PropertyFinancials,
+    PropertyType,
+    ZoningType,
+    Address
+)
+
+agent = ComparableDiscoveryAgent()
+
+def make_property(
+    property_id,
+    square_feet=10000.0,
+    year_built=None,
+    current_value=None,
+    property_type=PropertyType.INDUSTRIAL,
+    latitude=40.0,
+    longitude=-74.0
+):
+    return ValidatedProperty(
+        id=property_id,
+        property_type=property_type,
+        zoning_type=ZoningType.M1,
+        address=Address(street='1 Main St', city='Newark', state='NJ', zip_code='07102'),
+        metrics=PropertyMetrics(total_square_feet=square_feet, year_built=year_built),
+        financials=PropertyFinancials(current_value=current_value),
+        latitude=latitude,
+        longitude=longitude
+    )
+
+def random_properties(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        make_property(
+            str(i),
+            square_feet=rng.uniform(1000, 90000),
+            year_built=rng.choice([None, 1950, 1990, 1999, 2001, 2005]),
+            current_value=rng.choice([None, 0.0, rng.uniform(1e5, 1e7)]),
+            property_type=rng.choice(list(PropertyType)),
+            latitude=rng.choice([0.0, rng.uniform(40.0, 40.05)]),
+            longitude=rng.choice([0.0, rng.uniform(-74.0, -73.95)])
+        )
+        for i in range(count)
+    ]
+
+def find_comparables(target, candidates, limit):
+    return asyncio.run(agent.find_comparables(target, candidates, limit=limit))
+
+def test_ranking_matches_scalar_scoring():
+    properties = random_properties(200)
+    target = properties[0]
+
+    comparables = find_comparables(target, properties, limit=len(properties))
+
+    # Every candidate but the target, best first
+    assert sorted(c.property.id for c in comparables) == sorted(p.id for p in properties[1:])
+    scores = [c.similarity_score for c in comparables]
+    assert scores == sorted(scores, reverse=True)
+
+    for comparable in comparables:
+        expected = agent.calculate_similarity(target, comparable.property)
+        assert comparable.similarity_score == pytest.approx(expected.similarity_score)
+        assert comparable.matching_factors == pytest.approx(expected.matching_factors)
+        assert comparable.confidence_score == pytest.approx(agent.calculate_confidence(expected))
+
+def test_ties_keep_input_order():
+    target = make_property('target', square_feet=2000.0)
+    candidates = [
+        make_property(str(i), square_feet=[1000.0, 2000.0][i % 2])
+        for i in range(10)
+    ]
+
+    comparables = find_comparables(target, candidates, limit=10)
+
+    assert [c.property.id for c in comparables] == ['1', '3', '5', '7', '9', '0', '2', '4', '6', '8']
+
+def test_limit_larger_than_candidate_count():
+    properties = random_properties(5)
+
+    comparables = find_comparables(properties[0], properties, limit=50)
+
+    assert len(comparables) == 4
+    assert find_comparables(properties[0], [properties[0]], limit=3) == []
+    assert find_comparables(properties[0], [], limit=3) == []
+    assert find_comparables(properties[0], properties, limit=0) == []
+
+@pytest.mark.parametrize('count', [50, OFFLOAD_THRESHOLD])
+def test_find_comparables_batch_matches_single_calls(count):
+    properties = random_properties(count)
+    targets = properties[:10] + [make_property('outside', square_feet=5000.0)]
+
+    batch = asyncio.run(agent.find_comparables_batch(targets, properties, limit=7))
+    single = [find_comparables(target, properties, limit=7) for target in targets]
+
+    assert batch == single
+
+def test_find_comparables_batch_empty_inputs():
+    properties = random_properties(5)
+
+    assert asyncio.run(agent.find_comparables_batch([], properties)) == []
+    assert asyncio.run(agent.find_comparables_batch(properties[:2], [])) == [[], []]
@@ -0,0 +1,137 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from backend.utils.transform import DataTransformer, DATE_FORMATS
+
+transformer = DataTransformer()
+
+# Day above 12 so the day-first format cannot be read month-first
+SAMPLE_DATETIME = datetime(2024, 3, 17, 9, 5, 30)
+
+def parse_with_strptime(value):
+    """Reference parser: the first DATE_FORMATS entry strptime accepts"""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+@pytest.mark.parametrize('fmt', DATE_FORMATS)
+def test_normalize_date_supported_formats(fmt):
+    value = SAMPLE_DATETIME.strftime(fmt)
+    assert transformer.normalize_date(value) == datetime.strptime(value, fmt)
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-01-05', datetime(2024, 1, 5)),
+    ('2024-1-5', datetime(2024, 1, 5)),
+    ('01/02/2024', datetime(2024, 1, 2)),  # Month first when ambiguous
+    ('13/01/2024', datetime(2024, 1, 13)),  # Day first when month/day is invalid
+    ('2024-01-05T10:11:12', datetime(2024, 1, 5, 10, 11, 12)),
+    ('2024-01-05 10:11:12', datetime(2024, 1, 5, 10, 11, 12)),
+    ('2024-01-05   10:11:12', datetime(2024, 1, 5, 10, 11, 12)),
+])
+def test_normalize_date_valid(value, expected):
+    assert transformer.normalize_date(value) == expected
+    assert parse_with_strptime(value) == expected
+
+@pytest.mark.parametrize('value', [
+    '2023-02-30',
+    '02/30/2023',
+    '2024-13-01',
+    '31/31/2024',
+    '2024-01-05T25:00:00',
+    '2024-01-05 23:60:00',
+])
+def test_normalize_date_invalid_dates(value):
+    assert transformer.normalize_date(value) is None
+    assert parse_with_strptime(value) is None
+
+@pytest.mark.parametrize('value', [
+    ' 2024-01-05',
+    '2024-01-05 ',
+    '\t2024-01-05\n',
+])
+def test_normalize_date_surrounding_whitespace(value):
+    assert transformer.normalize_date(value) is None
+    assert parse_with_strptime(value) is None
+
+@pytest.mark.parametrize('value', [
+    '',
+    'abc',
+    '2024/01/05',
+    '05-01-2024',
+    '2024-01-05T10:11',
+    '2024-01-05T10:11:12Z',
+])
+def test_normalize_date_non_matching(value):
+    assert transformer.normalize_date(value) is None
+    assert parse_with_strptime(value) is None
+
+def test_normalize_date_passthrough_and_default():
+    default = datetime(2000, 1, 1)
+    assert transformer.normalize_date(SAMPLE_DATETIME) is SAMPLE_DATETIME
+    assert transformer.normalize_date(None, default) is default
+    assert transformer.normalize_date('abc', default) is default
+
+NUMERIC_STRINGS = ['$1,234.50', '-$5', '12', ' 7 ', '1e3', '1_000', '١٢', 'nan', '', '$', 'abc', None, np.nan]
+
+@pytest.mark.parametrize('values', [
+    pd.Series(NUMERIC_STRINGS, dtype=object),
+    pd.Series(NUMERIC_STRINGS),
+    pd.Series(NUMERIC_STRINGS + [12, 3.5, True], dtype=object),
+    pd.Series([1, 2.5, None, np.nan]),
+])
+def test_normalize_numeric_series_matches_scalar(values):
+    result = transformer.normalize_numeric_series(values, default=-1.0)
+    expected = [transformer.normalize_numeric(value, default=-1.0) for value in values]
+    assert result.tolist() == expected
+
+def test_normalize_numeric_missing_values_use_default():
+    assert transformer.normalize_numeric(None, 2.0) == 2.0
+    assert transformer.normalize_numeric(np.nan, 2.0) == 2.0
+    assert transformer.normalize_numeric('', 2.0) == 2.0
+    assert transformer.normalize_numeric('$1,000', 2.0) == 1000.0
+
+DATE_STRINGS = [
+    '2024-01-05', '01/13/2024', '13/01/2024', '2024-01-05T10:11:12',
+    '2024-01-05 10:11:12', '2023-02-30', ' 2024-01-05', '', 'abc', None, np.nan
+]
+
+@pytest.mark.parametrize('values', [
+    pd.Series(DATE_STRINGS, dtype=object),
+    pd.Series(DATE_STRINGS),
+])
+def test_normalize_date_series_matches_scalar(values):
+    result = transformer.normalize_date_series(values)
+    parsed = [None if pd.isna(value) else value.to_pydatetime() for value in result]
+    assert parsed == [transformer.normalize_date(value) for value in values]
+
+BOOLEAN_STRINGS = ['true', 'Yes', 'T', '1', 'y', 'false', 'no', '0', ' y', '', 'abc', None, np.nan]
+
+@pytest.mark.parametrize('values', [
+    pd.Series(BOOLEAN_STRINGS, dtype=object),
+    pd.Series(BOOLEAN_STRINGS),
+    pd.Series(BOOLEAN_STRINGS + [1, 0, 2.5, True, False], dtype=object),
+    pd.Series([1, 0, 2.5, None]),
+    pd.Series([True, False]),
+])
+@pytest.mark.parametrize('default', [False, True])
+def test_normalize_boolean_series_matches_scalar(values, default):
+    result = transformer.normalize_boolean_series(values, default=default)
+    assert result.dtype == bool
+    assert result.tolist() == [transformer.normalize_boolean(value, default) for value in values]
+
+def test_apply_pipeline_runs_transforms_in_order():
+    data = [{'price': '$1,000'}, {'price': ''}]
+    pipeline = [
+        lambda item: {**item, 'price': transformer.normalize_numeric(item['price'])},
+        lambda item: {**item, 'price': item['price'] * 2},
+    ]
+    assert transformer.apply_pipeline(data, pipeline) == [{'price': 2000.0}, {'price': 0.0}]
+    assert transformer.apply_pipeline(data, []) == data
+
+def test_apply_pipeline_propagates_errors():
+    with pytest.raises(KeyError):
+        transformer.apply_pipeline([{}], [lambda item: item['missing']])
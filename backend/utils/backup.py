@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Optional
 import shutil
 import gzip
+import tempfile
 from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -49,21 +50,37 @@ class BackupManager:
                 env = os.environ.copy()
                 env["PGPASSWORD"] = db_params["password"]
                 
-                # Execute pg_dump and compress output
-                with gzip.open(backup_file, 'wb') as gz:
-                    process = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        env=env
-                    )
-                    stdout, stderr = process.communicate()
-                    
-                    if process.returncode != 0:
-                        logger.error(f"Backup failed: {stderr.decode()}")
+                # Execute pg_dump and stream its output through the compressor
+                # (stderr goes to a temp file so a chatty pg_dump cannot block).
+                # The dump is written to a partial file and only moved into place
+                # once pg_dump succeeds, so a failed run never looks like a backup
+                partial_file = backup_file.with_suffix('.partial')
+                try:
+                    with gzip.open(partial_file, 'wb') as gz, tempfile.TemporaryFile() as err:
+                        process = subprocess.Popen(
+                            cmd,
+                            stdout=subprocess.PIPE,
+                            stderr=err,
+                            env=env
+                        )
+                        try:
+                            shutil.copyfileobj(process.stdout, gz)
+                        finally:
+                            # Always reap pg_dump, even if writing the backup failed
+                            process.stdout.close()
+                            returncode = process.wait()
+                        err.seek(0)
+                        stderr = err.read().decode()
+
+                    if returncode != 0:
+                        partial_file.unlink(missing_ok=True)
+                        logger.error(f"Backup failed: {stderr}")
                         return None
-                    
-                    gz.write(stdout)
+
+                    os.replace(partial_file, backup_file)
+                except Exception:
+                    partial_file.unlink(missing_ok=True)
+                    raise
                 
                 logger.info(f"Backup created successfully: {backup_file}")
                 return backup_file
@@ -104,18 +121,29 @@ class BackupManager:
                 env = os.environ.copy()
                 env["PGPASSWORD"] = db_params["password"]
                 
-                # Decompress and restore
-                with gzip.open(backup_file, 'rb') as gz:
+                # Decompress and stream into psql
+                with gzip.open(backup_file, 'rb') as gz, tempfile.TemporaryFile() as err:
                     process = subprocess.Popen(
                         cmd,
                         stdin=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
+                        stderr=err,
                         env=env
                     )
-                    _, stderr = process.communicate(gz.read())
+                    try:
+                        shutil.copyfileobj(gz, process.stdin)
+                    except BrokenPipeError:
+                        # psql exited early; its exit status and stderr say why
+                        pass
+                    finally:
+                        try:
+                            process.stdin.close()
+                        except BrokenPipeError:
+                            pass
+                        returncode = process.wait()
                     
-                    if process.returncode != 0:
-                        logger.error(f"Restore failed: {stderr.decode()}")
+                    if returncode != 0:
+                        err.seek(0)
+                        logger.error(f"Restore failed: {err.read().decode()}")
                         return False
                 
                 logger.info("Database restored successfully")
@@ -1,14 +1,25 @@
-import json
 import functools
+import orjson
 from typing import Any, Optional, Callable
 from redis import asyncio as aioredis
 from datetime import timedelta
 from backend.config.settings import get_settings
 from backend.utils.logger import setup_logger
+from backend.utils.serialization import dumps
 
 logger = setup_logger("cache")
 settings = get_settings()
 
+# Non-str keys are stringified as json.dumps did, while datetimes and
+# dataclasses still fail rather than coming back from the cache as strings and
+# dicts; numpy values are stored as plain numbers. Unlike json.dumps, NaN and
+# Infinity are stored as null and come back as None
+SERIALIZE_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS |
+    orjson.OPT_PASSTHROUGH_DATETIME |
+    orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
 def cache_result(ttl: int = 300):
     """
     Decorator to cache function results
@@ -91,7 +102,7 @@ class Cache:
         try:
             value = await self.redis.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
             logger.error(f"Cache get error: {str(e)}")
@@ -105,6 +116,7 @@ class Cache:
     ) -> bool:
         """
         Set value in cache
+        NaN and Infinity are stored as null, so they come back from get as None
         """
         if not self.redis:
             await self.connect()
@@ -112,7 +124,7 @@ class Cache:
             ttl = ttl or self.default_ttl
             return await self.redis.set(
                 key,
-                json.dumps(value),
+                dumps(value, option=SERIALIZE_OPTIONS),
                 ex=int(ttl.total_seconds())
             )
         except Exception as e:
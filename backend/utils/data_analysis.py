@@ -2,7 +2,30 @@ from typing import List, Dict, Optional
 from statistics import mean, median, stdev
 from math import radians, sin, cos, sqrt, atan2
 from datetime import datetime
-from backend.agents.data_extraction import Property
+import numpy as np
+from .validation import ValidatedProperty
+
+# Earth's radius in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+def haversine_distances(
+    lat: float,
+    lon: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray
+) -> np.ndarray:
+    """
+    Distances in km from one point to many points using a vectorized Haversine formula
+    """
+    lat1, lon1 = np.radians(lat), np.radians(lon)
+    lat2, lon2 = np.radians(latitudes), np.radians(longitudes)
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+
+    return EARTH_RADIUS_KM * c
 
 class DataAnalysis:
     @staticmethod
@@ -10,18 +33,28 @@ class DataAnalysis:
         """
         Calculate distance between two points using Haversine formula
         """
-        R = 6371  # Earth's radius in kilometers
-
         lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
         dlat = lat2 - lat1
         dlon = lon2 - lon1
 
         a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
         c = 2 * atan2(sqrt(a), sqrt(1-a))
-        distance = R * c
+        distance = EARTH_RADIUS_KM * c
 
         return distance
 
+    @staticmethod
+    def calculate_distances(
+        lat: float,
+        lon: float,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate distances from one point to many points using Haversine formula
+        """
+        return haversine_distances(lat, lon, latitudes, longitudes)
+
     @staticmethod
     def calculate_statistics(values: List[float]) -> Dict[str, float]:
         """
@@ -58,15 +91,16 @@ class DataAnalysis:
         return [i for i, x in enumerate(values) if abs((x - avg) / std) > threshold]
 
     @staticmethod
-    def calculate_property_age(property: Property) -> Optional[float]:
+    def calculate_property_age(property: ValidatedProperty) -> Optional[float]:
         """
         Calculate property age in years
         """
-        if not property.year_built:
+        year_built = property.metrics.year_built
+        if not year_built:
             return None
             
         current_year = datetime.now().year
-        return current_year - property.year_built
+        return current_year - year_built
 
     @staticmethod
     def normalize_value(
@@ -85,8 +119,8 @@ class DataAnalysis:
     @classmethod
     def calculate_similarity_score(
         cls,
-        target: Property,
-        comparable: Property,
+        target: ValidatedProperty,
+        comparable: ValidatedProperty,
         weights: Dict[str, float]
     ) -> float:
         """
@@ -103,7 +137,7 @@ class DataAnalysis:
         scores.append(location_score * weights.get("location", 0.3))
         
         # Size similarity
-        size_diff = abs(target.square_feet - comparable.square_feet)
+        size_diff = abs(target.metrics.total_square_feet - comparable.metrics.total_square_feet)
         size_score = 1 / (1 + size_diff/1000)  # Normalize to 0-1
         scores.append(size_score * weights.get("size", 0.25))
         
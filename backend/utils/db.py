@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncGenerator
 import logging
 from ..config.settings import get_settings
@@ -15,10 +16,14 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 def get_engine(database_url: str = None):
-    """Create SQLAlchemy async engine with the given database URL"""
+    """Get the SQLAlchemy async engine for the given database URL"""
     if database_url is None:
         database_url = settings.DATABASE_URL
-        
+    return _create_engine(database_url)
+
+@lru_cache(maxsize=8)
+def _create_engine(database_url: str):
+    """Create an async engine once per URL so its connection pool is reused"""
     # Convert standard PostgreSQL URL to async format
     if database_url.startswith('postgresql://'):
         database_url = database_url.replace('postgresql://', 'postgresql+asyncpg://')
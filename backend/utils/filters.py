@@ -1,16 +1,29 @@
 from typing import List, Dict, Optional
 from datetime import datetime
+import numpy as np
 from .validation import (
     ValidatedProperty,
     ValidationResult,
-    PropertyType,
-    ZoningType
+    INDUSTRIAL_PROPERTY_TYPES,
+    INDUSTRIAL_ZONING_TYPES
 )
 from .logger import setup_logger
 from .data_analysis import DataAnalysis
 
 logger = setup_logger("filters")
 
+# Feature predicates keyed by feature name, resolved with a single dict lookup
+FEATURE_CHECKS = {
+    'loading_docks': lambda prop: bool(prop.metrics.loading_docks),
+    'drive_in_doors': lambda prop: bool(prop.metrics.drive_in_doors),
+    'high_ceiling': lambda prop: bool(
+        prop.metrics.ceiling_height and prop.metrics.ceiling_height >= 14
+    ),
+    'office_space': lambda prop: bool(prop.metrics.office_square_feet),
+    'manufacturing_space': lambda prop: bool(prop.metrics.manufacturing_square_feet),
+    'warehouse_space': lambda prop: bool(prop.metrics.warehouse_square_feet),
+}
+
 class PropertyFilter:
     def __init__(self):
         self.logger = logger
@@ -59,21 +72,11 @@ class PropertyFilter:
         Checks if a property meets industrial criteria
         """
         # Check property type
-        if prop.property_type not in [
-            PropertyType.INDUSTRIAL,
-            PropertyType.WAREHOUSE,
-            PropertyType.MANUFACTURING,
-            PropertyType.FLEX
-        ]:
+        if prop.property_type not in INDUSTRIAL_PROPERTY_TYPES:
             return False
 
         # Check zoning
-        if prop.zoning_type not in [
-            ZoningType.M1,
-            ZoningType.M2,
-            ZoningType.I1,
-            ZoningType.I2
-        ]:
+        if prop.zoning_type not in INDUSTRIAL_ZONING_TYPES:
             return False
 
         # Check size
@@ -103,22 +106,8 @@ class PropertyFilter:
         """
         Checks if a property has a specific feature
         """
-        feature = feature.lower()
-        
-        if feature == 'loading_docks':
-            return bool(prop.metrics.loading_docks)
-        elif feature == 'drive_in_doors':
-            return bool(prop.metrics.drive_in_doors)
-        elif feature == 'high_ceiling':
-            return bool(prop.metrics.ceiling_height and prop.metrics.ceiling_height >= 14)
-        elif feature == 'office_space':
-            return bool(prop.metrics.office_square_feet)
-        elif feature == 'manufacturing_space':
-            return bool(prop.metrics.manufacturing_square_feet)
-        elif feature == 'warehouse_space':
-            return bool(prop.metrics.warehouse_square_feet)
-        
-        return False
+        check = FEATURE_CHECKS.get(feature.lower())
+        return check(prop) if check else False
 
     def filter_by_location(
         self,
@@ -130,6 +119,41 @@ class PropertyFilter:
         """
         Filters properties within a radius of a point
         """
+        if not properties:
+            return []
+
+        # Compute all distances in one vectorized pass over coordinate arrays
+        count = len(properties)
+        try:
+            latitudes = np.fromiter((prop.latitude for prop in properties), dtype=float, count=count)
+            longitudes = np.fromiter((prop.longitude for prop in properties), dtype=float, count=count)
+        except (TypeError, ValueError):
+            # A non-numeric coordinate; fall back to row by row so only
+            # that property is skipped
+            return self._filter_by_location_rowwise(properties, latitude, longitude, radius_km)
+
+        distances = self.data_analysis.calculate_distances(
+            latitude,
+            longitude,
+            latitudes,
+            longitudes
+        )
+
+        return [
+            prop for prop, distance in zip(properties, distances.tolist())
+            if distance <= radius_km
+        ]
+
+    def _filter_by_location_rowwise(
+        self,
+        properties: List[ValidatedProperty],
+        latitude: float,
+        longitude: float,
+        radius_km: float
+    ) -> List[ValidatedProperty]:
+        """
+        Filters properties within a radius of a point, one property at a time
+        """
         filtered = []
         
         for prop in properties:
@@ -1,6 +1,6 @@
 import logging
 import sys
-import json
+import orjson
 import traceback
 from pathlib import Path
 from datetime import datetime
@@ -8,6 +8,7 @@ from logging.handlers import RotatingFileHandler
 from typing import Dict, Optional, Any
 from functools import wraps
 from backend.config.settings import get_settings
+from backend.utils.serialization import dumps
 
 settings = get_settings()
 
@@ -38,7 +39,9 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, 'extra_data'):
             log_data['extra'] = record.extra_data
             
-        return json.dumps(log_data)
+        # Non-str keys are stringified as json.dumps would; anything else
+        # unserializable in caller-supplied extras is logged as its str()
+        return dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 class ErrorLogger:
     """
@@ -3,10 +3,11 @@ Market analysis utilities for processing and analyzing real estate data
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, Any, List, Optional
-from statistics import mean, median, stdev
+from statistics import mean, median
 from collections import defaultdict
+import numpy as np
 from backend.utils.cache import cache_result
 from backend.utils.db import get_session_maker
 from backend.models.property import Property
@@ -57,32 +58,28 @@ async def get_market_trends(start_date: datetime, end_date: datetime) -> Dict[st
                     "price_change": 0
                 }
 
-            # Process data by month
-            monthly_data = defaultdict(list)
+            # Process data by month, collecting prices and price per sqft
+            # directly instead of building and re-reading a dict per sale
+            monthly_prices = defaultdict(list)
+            monthly_price_per_sqft = defaultdict(list)
             for sale_date, price, sqft in sales_data:
                 if price is None:
                     continue  # Skip entries with no price
                     
-                month_key = sale_date.strftime("%Y-%m")
+                # Group on (year, month) and format the label once per month below
+                month_key = (sale_date.year, sale_date.month)
+                monthly_prices[month_key].append(price)
                 if sqft and sqft > 0:  # Avoid division by zero
-                    monthly_data[month_key].append({
-                        "price": price,
-                        "price_per_sqft": price / sqft
-                    })
-                else:
-                    monthly_data[month_key].append({
-                        "price": price,
-                        "price_per_sqft": None  # Mark as None to filter out later
-                    })
+                    monthly_price_per_sqft[month_key].append(price / sqft)
 
             # Calculate monthly metrics
             monthly_metrics = []
-            for month in sorted(monthly_data.keys()):
-                prices = [item["price"] for item in monthly_data[month]]
-                price_per_sqft = [item["price_per_sqft"] for item in monthly_data[month] if item["price_per_sqft"] is not None]
+            for month in sorted(monthly_prices.keys()):
+                prices = monthly_prices[month]
+                price_per_sqft = monthly_price_per_sqft[month]
                 
                 monthly_metrics.append({
-                    "date": month,
+                    "date": date(*month, 1).strftime("%Y-%m"),
                     "median_price": median(prices) if prices else 0,
                     "avg_price": mean(prices) if prices else 0,
                     "total_volume": sum(prices),
@@ -147,9 +144,9 @@ async def get_price_distribution() -> Dict[str, Any]:
             )
 
             result = await session.execute(stmt)
-            prices = [row[0] for row in result.fetchall()]
+            prices = np.fromiter((row[0] for row in result.fetchall()), dtype=float)
 
-            if not prices:
+            if not prices.size:
                 logger.warning("No price data found for distribution analysis")
                 return {
                     "distribution": [],
@@ -160,14 +157,15 @@ async def get_price_distribution() -> Dict[str, Any]:
                     }
                 }
 
-            # Calculate basic statistics
-            price_mean = mean(prices)
-            price_median = median(prices)
-            price_std_dev = stdev(prices) if len(prices) > 1 else 0
+            # Calculate basic statistics over the array instead of
+            # walking the price list once per statistic
+            price_mean = float(prices.mean())
+            price_median = float(np.median(prices))
+            price_std_dev = float(prices.std(ddof=1)) if prices.size > 1 else 0
 
             # Create price range buckets
-            min_price = min(prices)
-            max_price = max(prices)
+            min_price = float(prices.min())
+            max_price = float(prices.max())
             
             # Create 10 buckets for price distribution
             if min_price == max_price:
@@ -179,7 +177,7 @@ async def get_price_distribution() -> Dict[str, Any]:
             # Count properties in each bucket
             distribution = []
             for start, end in buckets:
-                count = sum(1 for price in prices if start <= price <= end)
+                count = int(np.count_nonzero((prices >= start) & (prices <= end)))
                 distribution.append({
                     "range": [start, end],
                     "count": count
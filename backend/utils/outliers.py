@@ -16,6 +16,11 @@ class OutlierDetector:
     def __init__(self):
         self.logger = logger
         self.scaler = StandardScaler()
+        self.detectors = {
+            'zscore': self.detect_zscore_outliers,
+            'iqr': self.detect_iqr_outliers,
+            'isolation_forest': self.detect_isolation_forest_outliers
+        }
 
     def detect_zscore_outliers(
         self,
@@ -105,6 +110,7 @@ class OutlierDetector:
                 'ceiling_height': p.metrics.ceiling_height or 0,
             } for p in properties])
 
+            ids = df['id'].values
             results = {}
             numeric_columns = [
                 'total_square_feet',
@@ -115,32 +121,32 @@ class OutlierDetector:
 
             for method in methods:
                 method_results = []
+                results[method] = method_results
+                
+                # Resolve the detector once per method; unknown methods find nothing
+                detect = self.detectors.get(method)
+                if detect is None:
+                    continue
                 
                 for col in numeric_columns:
                     if df[col].nunique() > 1:  # Skip if no variation
                         data = df[col].values
-                        outlier_indices = []
+                        outlier_indices = detect(data)
+                        if not outlier_indices:
+                            continue
                         
-                        if method == 'zscore':
-                            outlier_indices = self.detect_zscore_outliers(data)
-                        elif method == 'iqr':
-                            outlier_indices = self.detect_iqr_outliers(data)
-                        elif method == 'isolation_forest':
-                            outlier_indices = self.detect_isolation_forest_outliers(data)
+                        # Score all of the column's outliers against one pass of statistics
+                        values = data[outlier_indices]
+                        confidences = self._calculate_outlier_confidence(values, data)
                         
                         # Add outliers to results
-                        for idx in outlier_indices:
+                        for idx, value, confidence in zip(outlier_indices, values, confidences):
                             method_results.append({
-                                'property_id': df.iloc[idx]['id'],
+                                'property_id': ids[idx],
                                 'metric': col,
-                                'value': df.iloc[idx][col],
-                                'confidence': self._calculate_outlier_confidence(
-                                    df.iloc[idx][col],
-                                    data
-                                )
+                                'value': value,
+                                'confidence': float(confidence)
                             })
-                
-                results[method] = method_results
 
             return results
             
@@ -150,18 +156,29 @@ class OutlierDetector:
 
     def _calculate_outlier_confidence(
         self,
-        value: float,
+        values: np.ndarray,
         data: np.ndarray,
         max_zscore: float = 5.0
-    ) -> float:
+    ) -> np.ndarray:
         """
-        Calculates confidence score for outlier detection
+        Calculates confidence scores for outlier detection
+        Each value's Z-score is taken against the data with that value added once more
         """
         try:
-            z_score = abs(stats.zscore([value] + list(data))[0])
-            return min(z_score / max_zscore, 1.0)
+            # Summarize the data once, then fold each value in (Welford update)
+            # instead of recomputing a Z-score over the whole column per outlier
+            count = len(data)
+            mean = data.mean()
+            sum_sq = ((data - mean) ** 2).sum()
+            
+            delta = values - mean
+            new_mean = mean + delta / (count + 1)
+            new_std = np.sqrt((sum_sq + delta * (values - new_mean)) / (count + 1))
+            
+            z_scores = np.abs(values - new_mean) / new_std
+            return np.minimum(z_scores / max_zscore, 1.0)
         except Exception:
-            return 0.0
+            return np.zeros(len(values))
 
     def get_outlier_summary(
         self,
@@ -23,18 +23,12 @@ class DataQualityMetrics:
         Calculates completeness metrics for each field
         """
         try:
-            df = pd.DataFrame([p.dict() for p in properties])
+            # Flatten nested structures straight from the property dicts
+            df = pd.json_normalize([p.dict() for p in properties])
             
-            # Flatten nested structures
-            df = pd.json_normalize(df.to_dict('records'))
-            
-            # Calculate completeness for each column
-            completeness = {}
-            for col in df.columns:
-                if col != 'raw_data':  # Skip raw data field
-                    non_null = df[col].notna().sum()
-                    total = len(df)
-                    completeness[col] = (non_null / total) * 100
+            # Calculate completeness for every column at once
+            completeness = (df.notna().mean() * 100).to_dict()
+            completeness.pop('raw_data', None)  # Skip raw data field
                     
             return completeness
             
@@ -94,10 +88,8 @@ class DataQualityMetrics:
             
             for col, (min_val, max_val) in ranges.items():
                 if col in df.columns:
-                    valid_count = df[
-                        (df[col] >= min_val) & 
-                        (df[col] <= max_val)
-                    ].shape[0]
+                    # Count in-range values without copying the matching rows
+                    valid_count = int(df[col].between(min_val, max_val).sum())
                     
                     metrics[col] = {
                         'valid_percentage': (valid_count / len(df)) * 100,
@@ -160,33 +152,27 @@ class DataQualityMetrics:
                 return {k: 100.0 for k in consistency_checks}
             
             for prop in properties:
+                address = prop.address
+                financials = prop.financials
+                metrics = prop.metrics
+
                 # Check coordinates
                 if (-90 <= prop.latitude <= 90 and 
                     -180 <= prop.longitude <= 180):
                     consistency_checks['valid_coordinates'] += 1
                 
-                # Check address
-                if all([
-                    prop.address.street,
-                    prop.address.city,
-                    prop.address.state,
-                    prop.address.zip_code
-                ]):
+                # Check address (stops at the first missing component)
+                if (address.street and address.city and
+                        address.state and address.zip_code):
                     consistency_checks['valid_address'] += 1
                 
-                # Check financials
-                if any([
-                    prop.financials.last_sale_price,
-                    prop.financials.current_value,
-                    prop.financials.price_per_square_foot
-                ]):
+                # Check financials (stops at the first populated value)
+                if (financials.last_sale_price or financials.current_value or
+                        financials.price_per_square_foot):
                     consistency_checks['valid_financials'] += 1
                 
                 # Check metrics
-                if all([
-                    prop.metrics.total_square_feet > 0,
-                    prop.metrics.year_built is not None
-                ]):
+                if metrics.total_square_feet > 0 and metrics.year_built is not None:
                     consistency_checks['valid_metrics'] += 1
             
             # Convert to percentages
@@ -207,12 +193,20 @@ class DataQualityMetrics:
         Generates a comprehensive data quality report
         """
         try:
+            # Compute each metric once and reuse it for the overall score
+            completeness = self.calculate_completeness(properties)
+            accuracy = self.calculate_accuracy(properties)
+            
             report = {
                 'timestamp': datetime.now().isoformat(),
                 'total_properties': len(properties),
-                'completeness': self.calculate_completeness(properties),
-                'accuracy': self.calculate_accuracy(properties),
-                'quality_score': self._calculate_quality_score(properties)
+                'completeness': completeness,
+                'accuracy': accuracy,
+                'quality_score': self._calculate_quality_score(
+                    properties,
+                    completeness=completeness,
+                    accuracy=accuracy
+                )
             }
             
             return report
@@ -227,10 +221,13 @@ class DataQualityMetrics:
 
     def _calculate_quality_score(
         self,
-        properties: List[ValidatedProperty]
+        properties: List[ValidatedProperty],
+        completeness: Optional[Dict[str, float]] = None,
+        accuracy: Optional[Dict[str, Dict[str, float]]] = None
     ) -> float:
         """
         Calculates an overall data quality score
+        Reuses already computed completeness and accuracy metrics when given
         """
         try:
             weights = {
@@ -240,10 +237,12 @@ class DataQualityMetrics:
                 'outlier_impact': 0.2
             }
             
-            # Get metrics
-            completeness = self.calculate_completeness(properties)
-            accuracy = self.calculate_accuracy(properties)
-            consistency = self._check_data_consistency(properties)
+            # Get metrics; accuracy already includes the consistency checks
+            if completeness is None:
+                completeness = self.calculate_completeness(properties)
+            if accuracy is None:
+                accuracy = self.calculate_accuracy(properties)
+            consistency = accuracy['data_consistency']
             
             # Calculate component scores
             completeness_score = np.mean(list(completeness.values()))
@@ -0,0 +1,36 @@
+"""
+JSON serialization helpers
+"""
+
+import json
+from typing import Any, Callable, Optional
+import numpy as np
+import orjson
+
+def dumps(
+    value: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+    option: int = 0
+) -> bytes:
+    """
+    Serializes a value to JSON bytes with orjson, numpy scalars and arrays included
+    NaN and Infinity are written as null, as orjson always does
+    Values only the stdlib accepts (float subclasses, integers wider than 64 bits)
+    fall back to json.dumps, which raises TypeError where it always did
+    """
+    try:
+        return orjson.dumps(value, default=default, option=option | orjson.OPT_SERIALIZE_NUMPY)
+    except orjson.JSONEncodeError:
+        pass
+
+    def stdlib_default(obj: Any) -> Any:
+        # Keep numpy values as numbers on the fallback path too
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if default is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return default(obj)
+
+    return json.dumps(value, default=stdlib_default).encode()
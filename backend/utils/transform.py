@@ -1,9 +1,11 @@
+import re
+from functools import lru_cache
 from typing import List, Dict, Any, Callable, Optional, TypeVar, Union
 from datetime import datetime
 from decimal import Decimal
 import pandas as pd
 import numpy as np
-from .validation import ValidatedProperty
+from .validation import ValidatedProperty, PropertyMetrics, PropertyFinancials
 from .logger import setup_logger
 
 logger = setup_logger("transform")
@@ -11,6 +13,63 @@ logger = setup_logger("transform")
 T = TypeVar('T')
 TransformFunc = Callable[[Any], Any]
 
+# Date formats accepted by normalize_date
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S"
+)
+
+# Matches every DATE_FORMATS shape, capturing the date and time fields directly
+DATE_RE = re.compile(
+    r'(?P<year>[0-9]{4})-(?P<month>[0-9]{1,2})-(?P<day>[0-9]{1,2})'
+    r'(?:(?:T|\s+)(?P<hour>[0-9]{1,2}):(?P<minute>[0-9]{1,2}):(?P<second>[0-9]{1,2}))?'
+    r'|(?P<slash_first>[0-9]{1,2})/(?P<slash_second>[0-9]{1,2})/(?P<slash_year>[0-9]{4})',
+    re.IGNORECASE
+)
+
+# Removes currency symbols and thousands separators in one pass
+CURRENCY_STRIP = str.maketrans('', '', '$,')
+
+# Strings treated as boolean true (compared after lowercasing)
+TRUTHY_STRINGS = frozenset({'true', 'yes', '1', 'y', 't'})
+
+# (column, attribute) pairs flattened into to_dataframe rows
+METRIC_COLUMNS = tuple((f"metric_{name}", name) for name in PropertyMetrics.model_fields)
+FINANCIAL_COLUMNS = tuple((f"financial_{name}", name) for name in PropertyFinancials.model_fields)
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> Optional[datetime]:
+    """
+    Parses a date string in any of the DATE_FORMATS shapes; memoized since dates repeat across rows
+    """
+    match = DATE_RE.fullmatch(value)
+    if not match:
+        return None
+
+    fields = match.groupdict()
+    if fields['slash_year'] is None:
+        parts = [fields['year'], fields['month'], fields['day']]
+        if fields['hour'] is not None:
+            parts += [fields['hour'], fields['minute'], fields['second']]
+        candidates = [parts]
+    else:
+        # Slash dates are month/day first, falling back to day/month
+        candidates = [
+            [fields['slash_year'], fields['slash_first'], fields['slash_second']],
+            [fields['slash_year'], fields['slash_second'], fields['slash_first']]
+        ]
+
+    for parts in candidates:
+        try:
+            return datetime(*map(int, parts))
+        except ValueError:
+            continue
+
+    return None
+
 class DataTransformer:
     """
     Handles data transformations and normalizations
@@ -29,14 +88,67 @@ class DataTransformer:
         if value is None:
             return default
             
+        # Already-numeric values need no cleanup or exception guard;
+        # NaN counts as missing, as it does in normalize_numeric_series
+        value_type = type(value)
+        if value_type is float:
+            return value if value == value else default
+        if value_type is int:
+            return float(value)
+            
+        number = None
         try:
             if isinstance(value, str):
                 # Remove currency symbols and commas
-                value = value.replace('$', '').replace(',', '')
-            return float(value)
+                value = value.translate(CURRENCY_STRIP)
+                # Blank cells are the usual non-numeric input; reject them
+                # up front instead of through float()'s exception
+                if value:
+                    number = float(value)
+            else:
+                number = float(value)
         except (ValueError, TypeError):
-            self.logger.warning(f"Could not normalize numeric value: {value}")
-            return default
+            pass
+            
+        if number is not None:
+            return number if number == number else default
+            
+        self.logger.warning("Could not normalize numeric value: %s", value)
+        return default
+
+    def normalize_numeric_series(
+        self,
+        values: pd.Series,
+        default: float = 0.0
+    ) -> pd.Series:
+        """
+        Normalizes a column of numeric values in a single vectorized pass
+        Missing values (None/NaN) become the default; strings pd.to_numeric
+        rejects are retried with normalize_numeric, so results match it
+        """
+        if pd.api.types.is_numeric_dtype(values):
+            return values.astype(float).fillna(default)
+
+        if pd.api.types.infer_dtype(values, skipna=True) != 'string':
+            # Mixed columns fall back to the scalar rules
+            return values.map(lambda value: self.normalize_numeric(value, default)).astype(float)
+
+        # Remove currency symbols and commas, then coerce unparseable values
+        cleaned = (
+            values.astype(str)
+            .str.replace('$', '', regex=False)
+            .str.replace(',', '', regex=False)
+        )
+        numbers = pd.to_numeric(cleaned, errors='coerce')
+
+        # pd.to_numeric is stricter than float() ('1_000', non-ASCII digits),
+        # so only the values it could not parse go through the scalar rules
+        unparsed = numbers.isna() & values.notna()
+        if unparsed.any():
+            numbers[unparsed] = values[unparsed].map(
+                lambda value: self.normalize_numeric(value, default)
+            )
+        return numbers.fillna(default)
 
     def normalize_date(
         self,
@@ -52,29 +164,32 @@ class DataTransformer:
         if isinstance(value, datetime):
             return value
             
-        try:
-            if isinstance(value, str):
-                # Try common date formats
-                formats = [
-                    "%Y-%m-%d",
-                    "%m/%d/%Y",
-                    "%d/%m/%Y",
-                    "%Y-%m-%dT%H:%M:%S",
-                    "%Y-%m-%d %H:%M:%S"
-                ]
-                
-                for fmt in formats:
-                    try:
-                        return datetime.strptime(value, fmt)
-                    except ValueError:
-                        continue
-                        
-            self.logger.warning(f"Could not parse date value: {value}")
-            return default
-            
-        except Exception as e:
-            self.logger.error(f"Error normalizing date: {str(e)}")
-            return default
+        if isinstance(value, str):
+            parsed = _parse_date_string(value)
+            if parsed is not None:
+                return parsed
+                    
+        self.logger.warning("Could not parse date value: %s", value)
+        return default
+
+    def normalize_date_series(
+        self,
+        values: pd.Series
+    ) -> pd.Series:
+        """
+        Normalizes a column of date values, parsing each format column-wide
+        Unparseable values become NaT
+        """
+        parsed = pd.to_datetime(values, format=DATE_FORMATS[0], errors='coerce')
+
+        # Later formats only need to look at values still unparsed
+        for fmt in DATE_FORMATS[1:]:
+            missing = parsed.isna()
+            if not missing.any():
+                break
+            parsed[missing] = pd.to_datetime(values[missing], format=fmt, errors='coerce')
+
+        return parsed
 
     def normalize_boolean(
         self,
@@ -91,13 +206,38 @@ class DataTransformer:
             return value
             
         if isinstance(value, (int, float)):
-            return bool(value)
+            # NaN counts as missing, as it does in normalize_boolean_series
+            return bool(value) if value == value else default
             
         if isinstance(value, str):
-            return value.lower() in ['true', 'yes', '1', 'y', 't']
+            # Already-canonical input needs no lowercased copy
+            return value in TRUTHY_STRINGS or value.lower() in TRUTHY_STRINGS
             
         return default
 
+    def normalize_boolean_series(
+        self,
+        values: pd.Series,
+        default: bool = False
+    ) -> pd.Series:
+        """
+        Normalizes a column of boolean values, matching string columns in one vectorized pass
+        Missing values become the default
+        """
+        missing = values.isna()
+        
+        if pd.api.types.is_bool_dtype(values):
+            normalized = values
+        elif pd.api.types.is_numeric_dtype(values):
+            normalized = values != 0
+        elif pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            normalized = values.str.lower().isin(TRUTHY_STRINGS)
+        else:
+            # Mixed columns fall back to the scalar rules
+            normalized = values.map(lambda value: self.normalize_boolean(value, default))
+            
+        return normalized.mask(missing, default).astype(bool)
+
     def apply_pipeline(
         self,
         data: List[Dict],
@@ -106,13 +246,19 @@ class DataTransformer:
         """
         Applies a series of transformations to the data
         """
-        transformed = data
-        for transform in pipeline:
-            try:
-                transformed = [transform(item) for item in transformed]
-            except Exception as e:
-                self.logger.error(f"Pipeline transform error: {str(e)}")
-                raise
+        transforms = tuple(pipeline)
+        transformed = []
+        
+        # Run every item through the whole pipeline in one pass, instead of
+        # materializing an intermediate list per transform
+        try:
+            for item in data:
+                for transform in transforms:
+                    item = transform(item)
+                transformed.append(item)
+        except Exception as e:
+            self.logger.error(f"Pipeline transform error: {str(e)}")
+            raise
                 
         return transformed
 
@@ -137,12 +283,14 @@ class DataTransformer:
                 }
                 
                 # Add metrics
-                metrics = prop.metrics.dict()
-                row.update({f"metric_{k}": v for k, v in metrics.items()})
+                metrics = prop.metrics
+                for column, name in METRIC_COLUMNS:
+                    row[column] = getattr(metrics, name)
                 
                 # Add financials
-                financials = prop.financials.dict()
-                row.update({f"financial_{k}": v for k, v in financials.items()})
+                financials = prop.financials
+                for column, name in FINANCIAL_COLUMNS:
+                    row[column] = getattr(financials, name)
                 
                 data.append(row)
                 
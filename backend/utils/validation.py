@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, Field, validator
+from dataclasses import dataclass, field
+from pydantic import BaseModel, Field, ValidationError, validator
 from datetime import datetime
 from enum import Enum
 from .logger import setup_logger
@@ -25,6 +26,21 @@ class ZoningType(str, Enum):
     C2 = "C-2"  # Heavy Commercial
     MU = "MU"   # Mixed Use
 
+# Property and zoning types that qualify as industrial
+INDUSTRIAL_PROPERTY_TYPES = frozenset({
+    PropertyType.INDUSTRIAL,
+    PropertyType.WAREHOUSE,
+    PropertyType.MANUFACTURING,
+    PropertyType.FLEX
+})
+
+INDUSTRIAL_ZONING_TYPES = frozenset({
+    ZoningType.M1,
+    ZoningType.M2,
+    ZoningType.I1,
+    ZoningType.I2
+})
+
 class Address(BaseModel):
     street: str
     city: str
@@ -34,7 +50,8 @@ class Address(BaseModel):
 
     @validator('zip_code')
     def validate_zip_code(cls, v):
-        if not v.isdigit() or len(v) not in [5, 9]:
+        # Length test first so wrong-sized values skip the character scan
+        if len(v) not in (5, 9) or not v.isdigit():
             raise ValueError('Invalid ZIP code format')
         return v
 
@@ -98,10 +115,11 @@ class ValidatedProperty(BaseModel):
             datetime: lambda v: v.isoformat()
         }
 
-class ValidationResult(BaseModel):
+@dataclass(slots=True)
+class ValidationResult:
     is_valid: bool
-    errors: List[str] = Field(default_factory=list)
-    warnings: List[str] = Field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
     property: Optional[ValidatedProperty] = None
 
 class DataValidator:
@@ -119,8 +137,15 @@ class DataValidator:
                 is_valid=True,
                 property=property
             )
+        except ValidationError as e:
+            # Malformed input is an expected outcome; keep the log entry cheap
+            self.logger.debug(f"Validation failed with {e.error_count()} error(s)")
+            return ValidationResult(
+                is_valid=False,
+                errors=[str(e)]
+            )
         except Exception as e:
-            self.logger.error(f"Validation error: {str(e)}")
+            self.logger.error(f"Validation error: {str(e)}", exc_info=True)
             return ValidationResult(
                 is_valid=False,
                 errors=[str(e)]
@@ -134,38 +159,30 @@ class DataValidator:
         errors = []
 
         # Check property type
-        if property.property_type not in [
-            PropertyType.INDUSTRIAL,
-            PropertyType.WAREHOUSE,
-            PropertyType.MANUFACTURING,
-            PropertyType.FLEX
-        ]:
+        if property.property_type not in INDUSTRIAL_PROPERTY_TYPES:
             errors.append(f"Property type {property.property_type} is not industrial")
 
         # Check zoning
-        if property.zoning_type not in [
-            ZoningType.M1,
-            ZoningType.M2,
-            ZoningType.I1,
-            ZoningType.I2
-        ]:
+        if property.zoning_type not in INDUSTRIAL_ZONING_TYPES:
             errors.append(f"Zoning type {property.zoning_type} is not industrial")
 
+        metrics = property.metrics
+
         # Check size requirements
-        if property.metrics.total_square_feet < 10000:
+        if metrics.total_square_feet < 10000:
             warnings.append("Property may be too small for industrial use")
 
         # Check ceiling height if available
-        if property.metrics.ceiling_height is not None:
-            if property.metrics.ceiling_height < 14:
-                warnings.append("Ceiling height may be too low for industrial use")
+        ceiling_height = metrics.ceiling_height
+        if ceiling_height is not None and ceiling_height < 14:
+            warnings.append("Ceiling height may be too low for industrial use")
 
         # Check loading facilities
-        if (property.metrics.loading_docks is None and 
-            property.metrics.drive_in_doors is None):
+        loading_docks = metrics.loading_docks
+        drive_in_doors = metrics.drive_in_doors
+        if loading_docks is None and drive_in_doors is None:
             warnings.append("No loading facility information available")
-        elif (property.metrics.loading_docks == 0 and 
-              property.metrics.drive_in_doors == 0):
+        elif loading_docks == 0 and drive_in_doors == 0:
             warnings.append("Property has no loading facilities")
 
         return ValidationResult(
@@ -119,25 +119,22 @@ class VersionManager:
         if not v1 or not v2:
             raise ValueError("One or both versions not found")
         
-        # Compare changes
-        diffs = {
-            'added': {},
-            'removed': {},
-            'modified': {}
-        }
-        
-        all_keys = set(v1.changes.keys()) | set(v2.changes.keys())
+        # Compare changes, splitting keys with set operations on the key views
+        changes1 = v1.changes
+        changes2 = v2.changes
         
-        for key in all_keys:
-            if key not in v1.changes:
-                diffs['added'][key] = v2.changes[key]
-            elif key not in v2.changes:
-                diffs['removed'][key] = v1.changes[key]
-            elif v1.changes[key] != v2.changes[key]:
-                diffs['modified'][key] = {
-                    'from': v1.changes[key],
-                    'to': v2.changes[key]
+        diffs = {
+            'added': {key: changes2[key] for key in changes2.keys() - changes1.keys()},
+            'removed': {key: changes1[key] for key in changes1.keys() - changes2.keys()},
+            'modified': {
+                key: {
+                    'from': changes1[key],
+                    'to': changes2[key]
                 }
+                for key in changes1.keys() & changes2.keys()
+                if changes1[key] != changes2[key]
+            }
+        }
         
         return diffs
     